@@ -65,6 +65,14 @@ class AssessmentCategory(str, Enum):
         return labels[self]
 
 
+# Weights re-keyed by enum member so overall_score skips the per-category
+# .value attribute access and string hash on every computation
+_WEIGHTS_BY_CATEGORY: dict[AssessmentCategory, float] = {
+    category: CATEGORY_WEIGHTS.get(category.value, 0)
+    for category in AssessmentCategory
+}
+
+
 class IssueSeverity(int, Enum):
     INFO = 1
     WARNING = 2
@@ -136,7 +144,7 @@ class AssessmentResult(BaseModel):
     def overall_score(self) -> float:
         """Calculate weighted overall score using CATEGORY_WEIGHTS from field_mappings."""
         total = sum(
-            score * CATEGORY_WEIGHTS.get(category.value, 0)
+            score * _WEIGHTS_BY_CATEGORY.get(category, 0)
             for category, score in self.category_scores.items()
         )
         return round(total, 2)
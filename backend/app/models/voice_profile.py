@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class ToneStyle(str, Enum):
@@ -34,6 +34,29 @@ class RuleType(str, Enum):
     CUSTOM = "custom"
 
 
+# Constant lookup tables for VoiceProfile.to_prompt_context (built once at
+# import instead of per call)
+_FORMALITY_DESCRIPTIONS = {
+    1: "Very formal and corporate",
+    2: "Professional and polished",
+    3: "Professional but approachable",
+    4: "Friendly and conversational",
+    5: "Casual and energetic",
+}
+
+_ADDRESS_DESCRIPTIONS = {
+    AddressStyle.DIRECT_YOU: 'Address candidates directly using "you" and "your".',
+    AddressStyle.THIRD_PERSON: 'Use third person like "the candidate" or "the ideal person".',
+    AddressStyle.WE_LOOKING: 'Frame from company perspective: "We\'re looking for someone who..."',
+}
+
+_SENTENCE_DESCRIPTIONS = {
+    SentenceStyle.SHORT_PUNCHY: "Use short, punchy sentences. Maximum 2-3 sentences per paragraph.",
+    SentenceStyle.BALANCED: "Use balanced sentence length. Mix of short and medium sentences.",
+    SentenceStyle.DETAILED: "Use detailed, thorough sentences. Complete explanations.",
+}
+
+
 class StructurePreferences(BaseModel):
     """Preferences for JD structure and section ordering."""
     lead_with_benefits: bool = False
@@ -103,33 +126,27 @@ class VoiceProfile(BaseModel):
     example_jd: Optional[str] = None  # Legacy single example
     is_default: bool = False
 
+    # Memoized to_prompt_context output (profiles are deserialized per
+    # request and never mutated server-side, so the first build stays valid)
+    _prompt_context: Optional[str] = PrivateAttr(default=None)
+
     def to_prompt_context(self) -> str:
-        """Generate prompt context for AI from this profile."""
-        formality_descriptions = {
-            1: "Very formal and corporate",
-            2: "Professional and polished",
-            3: "Professional but approachable",
-            4: "Friendly and conversational",
-            5: "Casual and energetic",
-        }
-
-        address_descriptions = {
-            AddressStyle.DIRECT_YOU: 'Address candidates directly using "you" and "your".',
-            AddressStyle.THIRD_PERSON: 'Use third person like "the candidate" or "the ideal person".',
-            AddressStyle.WE_LOOKING: 'Frame from company perspective: "We\'re looking for someone who..."',
-        }
-
-        sentence_descriptions = {
-            SentenceStyle.SHORT_PUNCHY: "Use short, punchy sentences. Maximum 2-3 sentences per paragraph.",
-            SentenceStyle.BALANCED: "Use balanced sentence length. Mix of short and medium sentences.",
-            SentenceStyle.DETAILED: "Use detailed, thorough sentences. Complete explanations.",
-        }
+        """Generate prompt context for AI from this profile.
+
+        The result is memoized on the instance — analysis builds the same
+        context for both the analysis and improvement prompts within one
+        request.
+        """
+        if self._prompt_context is None:
+            self._prompt_context = self._build_prompt_context()
+        return self._prompt_context
 
+    def _build_prompt_context(self) -> str:
         parts = [
             f"VOICE PROFILE: {self.name}",
-            f"Tone: {self.tone_description} ({formality_descriptions.get(self.tone_formality, 'Professional')})",
-            f"Address Style: {address_descriptions[self.address_style]}",
-            f"Sentence Style: {sentence_descriptions[self.sentence_style]}",
+            f"Tone: {self.tone_description} ({_FORMALITY_DESCRIPTIONS.get(self.tone_formality, 'Professional')})",
+            f"Address Style: {_ADDRESS_DESCRIPTIONS[self.address_style]}",
+            f"Sentence Style: {_SENTENCE_DESCRIPTIONS[self.sentence_style]}",
         ]
 
         # Structure preferences
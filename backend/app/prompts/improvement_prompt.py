@@ -195,7 +195,9 @@ def build_improvement_prompt(
             suggestion = issue.get("suggestion", "")
 
             issue_text = f"{i}. [{severity}] {category}: {description}"
-            if found:
+            # Skip the Found line when the description already quotes the
+            # text (rule-based issues embed it) - pure duplicate tokens
+            if found and found not in description:
                 issue_text += f"\n   Found: \"{found}\""
             if suggestion:
                 issue_text += f"\n   Fix: {suggestion}"
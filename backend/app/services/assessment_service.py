@@ -1,5 +1,6 @@
 # backend/app/services/assessment_service.py
 
+import asyncio
 import logging
 from typing import Optional
 from app.models.assessment import (
@@ -20,9 +21,29 @@ from app.services.scoring import (
 from app.services.claude_service import ClaudeService, AnalyzeRequest
 from app.services.question_analyzer import QuestionCoverageAnalyzer
 from app.services.issue_detector import IssueDetector
+from app.services.field_mappings import get_severity_map, get_category_map
 
 logger = logging.getLogger(__name__)
 
+# String -> enum maps for AI response parsing, resolved once at import
+_SEVERITY_MAP = get_severity_map()
+_CATEGORY_MAP = get_category_map()
+
+# Precomputed severity -> lowercase label (avoids enum .name.lower() per issue)
+_SEVERITY_LABELS = {severity: severity.name.lower() for severity in IssueSeverity}
+
+# Precomputed (category, value, lowercase label) triples so the per-analysis
+# evidence loop avoids repeated enum descriptor lookups
+_CATEGORY_META = tuple(
+    (category, category.value, category.label.lower())
+    for category in AssessmentCategory
+)
+
+
+def _canon(description: str) -> str:
+    """Canonicalize an issue description for dedup (case/whitespace-insensitive)."""
+    return " ".join(description.lower().split())
+
 
 class AssessmentService:
     """
@@ -33,6 +54,9 @@ class AssessmentService:
     Question coverage: Rufus-inspired candidate Q&A analysis
     """
 
+    # Minimum JD length worth analyzing (matches the /api/analyze validation)
+    MIN_JD_LENGTH = 50
+
     def __init__(self, claude_api_key: str):
         self.claude_service = ClaudeService(api_key=claude_api_key)
         self.question_analyzer = QuestionCoverageAnalyzer()
@@ -42,11 +66,15 @@ class AssessmentService:
         self, text: str, excluded_fields: Optional[set[str]] = None
     ) -> dict[AssessmentCategory, float]:
         """Calculate scores using deterministic algorithms, respecting excluded fields."""
-        completeness_score, _ = calculate_completeness_score(text, excluded_fields)
+        # Completeness and structure both scan a lowercased copy; make it once
+        text_lower = text.lower()
+        completeness_score, _ = calculate_completeness_score(
+            text, excluded_fields, text_lower
+        )
 
         return {
             AssessmentCategory.READABILITY: calculate_readability_score(text),
-            AssessmentCategory.STRUCTURE: calculate_structure_score(text),
+            AssessmentCategory.STRUCTURE: calculate_structure_score(text, text_lower),
             AssessmentCategory.COMPLETENESS: completeness_score,
         }
 
@@ -69,24 +97,22 @@ class AssessmentService:
         return merged
 
     def _convert_ai_issues(self, ai_issues: list[dict]) -> list[Issue]:
-        """Convert AI response issues to Issue models."""
-        from app.services.field_mappings import get_severity_map, get_category_map
+        """Convert AI response issues to Issue models.
 
-        issues = []
-        severity_map = get_severity_map()
-        category_map = get_category_map()
-
-        for ai_issue in ai_issues:
-            issues.append(Issue(
-                severity=severity_map.get(ai_issue.get("severity", "info"), IssueSeverity.INFO),
-                category=category_map.get(ai_issue.get("category", "clarity"), AssessmentCategory.CLARITY),
+        Uses the validating constructor deliberately: this input comes from
+        the AI response, which is untrusted.
+        """
+        return [
+            Issue(
+                severity=_SEVERITY_MAP.get(ai_issue.get("severity", "info"), IssueSeverity.INFO),
+                category=_CATEGORY_MAP.get(ai_issue.get("category", "clarity"), AssessmentCategory.CLARITY),
                 description=ai_issue.get("description", ""),
                 found=ai_issue.get("found"),
                 suggestion=ai_issue.get("suggestion"),
                 impact=ai_issue.get("impact"),
-            ))
-
-        return issues
+            )
+            for ai_issue in ai_issues
+        ]
 
     def _build_category_evidence(
         self,
@@ -97,12 +123,11 @@ class AssessmentService:
         """Build evidence for each category from AI response and rule-based data."""
         evidence = {}
 
-        for category in AssessmentCategory:
+        for category, cat_key, label_lower in _CATEGORY_META:
             score = final_scores.get(category, 75)
             status = EvidenceStatus.from_score(score)
 
             # Get AI-provided evidence for this category
-            cat_key = category.value
             ai_cat_evidence = ai_evidence.get(cat_key, {})
 
             # Build evidence with fallbacks for rule-based categories
@@ -124,7 +149,7 @@ class AssessmentService:
                 status=status,
                 supporting_excerpts=supporting[:3],  # Limit to top 3
                 missing_elements=missing[:3],
-                opportunity=opportunity or f"Improve {category.label.lower()}",
+                opportunity=opportunity or f"Improve {label_lower}",
                 impact_prediction=impact,
             )
 
@@ -138,15 +163,34 @@ class AssessmentService:
         """
         Full analysis combining rule-based and AI assessment.
         """
+        # Guard against empty/trivial input before spending an API call.
+        # The /api/analyze router enforces min_length=50 too, but direct
+        # callers of the service should get the same cheap short-circuit.
+        if not jd_text or len(jd_text.strip()) < self.MIN_JD_LENGTH:
+            return AssessmentResult(
+                category_scores={c: 0 for c in AssessmentCategory},
+                issues=[Issue(
+                    severity=IssueSeverity.CRITICAL,
+                    category=AssessmentCategory.COMPLETENESS,
+                    description="Job description too short to analyze",
+                    suggestion=f"Provide at least {self.MIN_JD_LENGTH} characters of JD text",
+                )],
+                positives=[],
+                improved_text=jd_text,
+            )
+
         # Get excluded fields from voice profile rules
         excluded_fields = self.issue_detector.get_excluded_fields_from_profile(voice_profile)
 
-        # Rule-based analysis (fast, deterministic) - respects excluded fields
-        rule_scores = self._calculate_rule_based_scores(jd_text, excluded_fields)
-        rule_issues = self.issue_detector.detect_all_issues(jd_text, voice_profile)
-
-        # Question coverage analysis (Rufus-inspired) - respects excluded topics
-        question_coverage_raw = self.question_analyzer.analyze(jd_text, excluded_fields)
+        # Rule-based analysis (fast, deterministic) - respects excluded fields.
+        # The three passes are independent CPU-bound scans over the same text,
+        # so run them on the thread pool instead of serially blocking the loop.
+        rule_scores, rule_issues, question_coverage_raw = await asyncio.gather(
+            asyncio.to_thread(self._calculate_rule_based_scores, jd_text, excluded_fields),
+            asyncio.to_thread(self.issue_detector.detect_all_issues, jd_text, voice_profile),
+            # Question coverage analysis (Rufus-inspired) - respects excluded topics
+            asyncio.to_thread(self.question_analyzer.analyze, jd_text, excluded_fields),
+        )
         questions_answered = sum(1 for q in question_coverage_raw if q.is_answered)
 
         # Convert to model format
@@ -164,8 +208,11 @@ class AssessmentService:
         ]
 
         # AI analysis (nuanced, contextual)
+        # AnalyzeRequest is an internal DTO; jd_text and voice_profile were
+        # already validated at the API boundary, so skip re-validation here
+        # (which would deep-copy the nested VoiceProfile model).
         ai_response = await self.claude_service.analyze(
-            AnalyzeRequest(jd_text=jd_text, voice_profile=voice_profile)
+            AnalyzeRequest.model_construct(jd_text=jd_text, voice_profile=voice_profile)
         )
 
         # Extract AI scores
@@ -190,12 +237,12 @@ class AssessmentService:
 
         # Combine issues (deduplicate by description and filter by excluded fields)
         ai_issues = self._convert_ai_issues(ai_response.get("issues", []))
-        seen_descriptions = {i.description for i in rule_issues}
+        seen_descriptions = {_canon(i.description) for i in rule_issues}
 
         # Filter AI issues that conflict with voice profile exclusions
         filtered_ai_issues = []
         for issue in ai_issues:
-            if issue.description in seen_descriptions:
+            if _canon(issue.description) in seen_descriptions:
                 continue  # Already in rule issues, skip duplicate
 
             # Check if this issue is about an excluded topic
@@ -204,10 +251,18 @@ class AssessmentService:
 
             filtered_ai_issues.append(issue)
 
-        all_issues = rule_issues + filtered_ai_issues
-
-        # Sort issues by severity
-        all_issues.sort(key=lambda i: i.severity.value, reverse=True)
+        # Order issues by severity (critical first) with a 3-bucket partition.
+        # IssueSeverity has exactly 3 members, so this is a single O(N) pass
+        # with no per-item key callback, unlike list.sort with a lambda.
+        critical, warning, info = [], [], []
+        for issue in rule_issues + filtered_ai_issues:
+            if issue.severity is IssueSeverity.CRITICAL:
+                critical.append(issue)
+            elif issue.severity is IssueSeverity.WARNING:
+                warning.append(issue)
+            else:
+                info.append(issue)
+        all_issues = critical + warning + info
 
         # Calculate potential application boost
         bias_issue_count = sum(1 for i in all_issues if i.category == AssessmentCategory.INCLUSIVITY)
@@ -232,7 +287,7 @@ class AssessmentService:
         # Format issues for improvement prompt
         issues_for_improvement = [
             {
-                "severity": issue.severity.name.lower(),
+                "severity": _SEVERITY_LABELS[issue.severity],
                 "category": issue.category.value,
                 "description": issue.description,
                 "found": issue.found,
@@ -10,31 +10,86 @@ This service focuses on:
 - JSON parsing and validation
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
+import time
+from collections import OrderedDict
 from typing import Optional
-from pydantic import BaseModel
-from anthropic import AsyncAnthropic
+import httpx
+import orjson
+from pydantic import BaseModel, ConfigDict
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from app.config import get_settings
 
 from app.models.voice_profile import VoiceProfile
 from app.prompts import (
-    build_analysis_prompt,
-    build_generation_prompt,
+    build_analysis_parts,
+    build_generation_parts,
     build_improvement_prompt,
-    build_voice_extraction_prompt,
+    build_voice_extraction_parts,
 )
 
 logger = logging.getLogger(__name__)
 
+# One AsyncAnthropic client per API key, shared across ClaudeService
+# instances. FastAPI constructs a fresh service per request via Depends;
+# without this each request paid for a new httpx connection pool and TLS
+# handshake instead of reusing warm connections.
+_client_cache: dict[str, AsyncAnthropic] = {}
+
+# Shared analyze response cache: key -> (stored_at, parsed dict). Lives at
+# module level because FastAPI constructs a fresh ClaudeService per request
+# via Depends — an instance attribute would never survive long enough to be
+# hit. Entries expire after claude_cache_ttl seconds so a long-running
+# worker doesn't serve stale analyses forever.
+_resp_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+
+def _get_shared_client(api_key: str) -> AsyncAnthropic:
+    client = _client_cache.get(api_key)
+    if client is None:
+        # The SDK's pool defaults are generous (1000 connections) but expire
+        # keepalive connections after 5s idle — shorter than the gap between
+        # interactive analyses, so most calls paid a fresh TLS handshake.
+        # A 60s expiry keeps connections warm across a user's session.
+        client = _client_cache.setdefault(
+            api_key,
+            AsyncAnthropic(
+                api_key=api_key,
+                http_client=DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=1000,
+                        max_keepalive_connections=100,
+                        keepalive_expiry=60.0,
+                    ),
+                ),
+            ),
+        )
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close pooled Anthropic clients (called from app shutdown)."""
+    for client in _client_cache.values():
+        await client.close()
+    _client_cache.clear()
+
 
 class AnalyzeRequest(BaseModel):
+    # Frozen: these DTOs are read-only once built, and freezing lets
+    # pydantic-core skip mutation bookkeeping
+    model_config = ConfigDict(frozen=True)
+
     jd_text: str
     voice_profile: Optional[VoiceProfile] = None
 
 
 class GenerateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     role_title: str
     responsibilities: list[str]
     requirements: list[str]
@@ -61,9 +116,63 @@ Your expertise includes:
 
 Always provide specific, actionable feedback with concrete suggestions."""
 
+    # Structured system blocks with cache_control so Anthropic caches the
+    # stable prefix across calls (cache reads are billed at ~10% of input
+    # token cost and cut time-to-first-token on hits).
+    SYSTEM_BLOCKS = [
+        {
+            "type": "text",
+            "text": SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+    # Precompiled response-parsing patterns (compiled once at class load
+    # instead of per call)
+    _JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+    # Common preambles the model might add before the improved JD, collapsed
+    # into one alternation so cleanup is a single pass
+    _PREAMBLE_RE = re.compile(
+        r"^(?:Here['']s the improved (?:version|job description)"
+        r"|Improved (?:version|job description)"
+        r"|Below is the improved)[:\s]*\n*",
+        re.IGNORECASE,
+    )
+
+    # Max entries in the shared analyze response cache
+    _RESP_CACHE_MAX = 512
+
+    # Sonnet 4.5 max output limit
+    MAX_OUTPUT_TOKENS = 8192
+
+    @staticmethod
+    def _estimate_max_tokens(jd_text: str) -> int:
+        """Scale the analyze output ceiling with input size.
+
+        Analysis output grows roughly with JD length (quoted excerpts,
+        per-issue found/suggestion text); a short JD never needs the full
+        8192-token ceiling, so don't reserve it.
+        """
+        return min(ClaudeService.MAX_OUTPUT_TOKENS, max(1024, 2 * len(jd_text) // 3))
+
+    # Model names resolved from settings once and memoized on the class;
+    # __init__ runs per request under FastAPI DI, so keep it to dict lookups
+    _MODEL: Optional[str] = None
+    _FAST_MODEL: Optional[str] = None
+    _CACHE_TTL: Optional[int] = None
+
     def __init__(self, api_key: str):
-        self.client = AsyncAnthropic(api_key=api_key)
-        self.model = get_settings().claude_model
+        self.client = _get_shared_client(api_key)
+        if ClaudeService._MODEL is None:
+            settings = get_settings()
+            ClaudeService._MODEL = settings.claude_model
+            ClaudeService._FAST_MODEL = settings.claude_fast_model
+            ClaudeService._CACHE_TTL = settings.claude_cache_ttl
+        self.model = ClaudeService._MODEL
+        # Smaller/faster tier for structured extraction where Sonnet-level
+        # quality isn't needed (voice profile extraction has a fixed schema)
+        self.fast_model = ClaudeService._FAST_MODEL
 
     def _extract_json(self, text: str) -> str:
         """Extract first complete JSON object from text using brace counting.
@@ -81,40 +190,73 @@ Always provide specific, actionable feedback with concrete suggestions."""
 
         For most Claude API responses, this is sufficient. If issues arise,
         prefer using markdown code blocks (```json ... ```) which are parsed first.
+
+        Scans by jumping between structural characters with str.find (a C-level
+        scan) instead of visiting every character in the Python loop, so long
+        prose/string spans are skipped in single calls.
         """
         depth = 0
         start = None
         in_string = False
-        escape_next = False
+        i = 0
+        n = len(text)
+        find = text.find
 
-        for i, char in enumerate(text):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == '\\':
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
+        while i < n:
             if in_string:
+                # Only an escape or a closing quote matters inside a string
+                quote = find('"', i)
+                backslash = find('\\', i)
+                if backslash != -1 and (quote == -1 or backslash < quote):
+                    i = backslash + 2  # Skip the escaped character
+                    continue
+                if quote == -1:
+                    break  # Unterminated string
+                in_string = False
+                i = quote + 1
                 continue
 
-            if char == '{':
+            # Outside a string: jump to the nearest structural character
+            nearest = n
+            char = ''
+            for candidate in ('"', '{', '}', '\\'):
+                pos = find(candidate, i)
+                if pos != -1 and pos < nearest:
+                    nearest, char = pos, candidate
+
+            if char == '':
+                break
+            if char == '\\':
+                i = nearest + 2  # Mirror the old escape handling outside strings
+            elif char == '"':
+                in_string = True
+                i = nearest + 1
+            elif char == '{':
                 if depth == 0:
-                    start = i
+                    start = nearest
                 depth += 1
-            elif char == '}':
+                i = nearest + 1
+            else:  # '}'
                 depth -= 1
                 if depth == 0 and start is not None:
-                    return text[start:i+1]
+                    return text[start:nearest + 1]
+                i = nearest + 1
 
         return text  # Fallback to original text
 
     def _parse_json_response(self, response_text: str) -> dict:
         """Parse Claude's JSON response, handling markdown code blocks."""
+        # Fast path: with a JSON-shaped prompt the response usually is pure
+        # JSON, so try parsing directly before any regex/extraction work.
+        # orjson parses the multi-KB analysis bodies 2-4x faster than stdlib
+        # json (its JSONDecodeError subclasses json.JSONDecodeError).
+        try:
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            pass
+
         # Extract JSON from response (handle markdown code blocks)
-        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+        json_match = self._JSON_FENCE_RE.search(response_text)
         if json_match:
             response_text = json_match.group(1)
         else:
@@ -122,15 +264,14 @@ Always provide specific, actionable feedback with concrete suggestions."""
             response_text = self._extract_json(response_text)
 
         try:
-            return json.loads(response_text)
-        except json.JSONDecodeError as e:
-            # Check for signs of truncation
-            open_braces = response_text.count('{')
-            close_braces = response_text.count('}')
-            open_brackets = response_text.count('[')
-            close_brackets = response_text.count(']')
-
-            if open_braces > close_braces or open_brackets > close_brackets:
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
+            # Check for signs of truncation. `or` short-circuits so the
+            # bracket scans only run when the braces already balance.
+            if (
+                response_text.count('{') > response_text.count('}')
+                or response_text.count('[') > response_text.count(']')
+            ):
                 raise ValueError(
                     f"AI response appears truncated (unmatched braces/brackets). "
                     f"This may happen with very long job descriptions. "
@@ -139,26 +280,89 @@ Always provide specific, actionable feedback with concrete suggestions."""
 
             raise ValueError(f"Failed to parse AI response as JSON: {e}. Response: {response_text[:500]}")
 
+    @staticmethod
+    def _cached_user_content(static_part: str, dynamic_part: str) -> list[dict]:
+        """Split a prompt into content blocks with cache_control on the
+        static prefix.
+
+        The prompt builders keep their invariant text (instructions, output
+        schema, guidelines) ahead of the per-request text, so the first block
+        is byte-identical across calls and Anthropic's prompt cache serves it
+        at ~10% of input token cost after the first request.
+        """
+        return [
+            {
+                "type": "text",
+                "text": static_part,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": dynamic_part},
+        ]
+
     def _extract_response_text(self, message) -> str:
         """Extract text content from Claude API response, with validation."""
         if not message.content or not hasattr(message.content[0], 'text'):
             raise ValueError("Unexpected response format from Claude API: empty or invalid content")
         return message.content[0].text
 
-    async def analyze(self, request: AnalyzeRequest) -> dict:
-        """Analyze a job description using Claude."""
-        prompt = build_analysis_prompt(request.jd_text, request.voice_profile)
+    def _cache_key(self, prompt: str, temperature: float) -> str:
+        """Content-addressed key for the response cache (blake2b is the
+        fastest hash in the stdlib)."""
+        return hashlib.blake2b(
+            f"{self.model}|{temperature}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+
+    async def analyze(self, request: AnalyzeRequest, use_cache: bool = True) -> dict:
+        """Analyze a job description using Claude.
+
+        Identical (model, temperature, prompt) requests are served from an
+        in-memory LRU cache; pass use_cache=False to force a fresh call.
+        """
+        static_part, dynamic_part = build_analysis_parts(
+            request.jd_text, request.voice_profile
+        )
+
+        cache_key = None
+        if use_cache:
+            # The static part is process-constant, so the dynamic part alone
+            # identifies the request
+            cache_key = self._cache_key(dynamic_part, temperature=0.3)
+            cached = _resp_cache.get(cache_key)
+            if cached is not None:
+                stored_at, result = cached
+                if time.monotonic() - stored_at < self._CACHE_TTL:
+                    _resp_cache.move_to_end(cache_key)
+                    logger.debug("Serving analyze response from cache")
+                    return result
+                del _resp_cache[cache_key]
 
         logger.debug(f"Sending analyze request. JD length: {len(request.jd_text)} chars")
 
+        max_tokens = self._estimate_max_tokens(request.jd_text)
+        content = self._cached_user_content(static_part, dynamic_part)
         message = await self.client.messages.create(
             model=self.model,
-            max_tokens=8192,  # Sonnet 4.5 max output limit
+            max_tokens=max_tokens,
             temperature=0.3,  # Lower temperature for faster, more deterministic inference
-            system=self.SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            system=self.SYSTEM_BLOCKS,
+            messages=[{"role": "user", "content": content}],
         )
 
+        # If the response hit our estimated ceiling (not the model's hard
+        # limit), retry once with the full budget before giving up.
+        if message.stop_reason == "max_tokens" and max_tokens < self.MAX_OUTPUT_TOKENS:
+            logger.warning(
+                f"Analyze response hit estimated ceiling of {max_tokens} tokens, "
+                f"retrying at hard limit {self.MAX_OUTPUT_TOKENS}"
+            )
+            message = await self.client.messages.create(
+                model=self.model,
+                max_tokens=self.MAX_OUTPUT_TOKENS,
+                temperature=0.3,
+                system=self.SYSTEM_BLOCKS,
+                messages=[{"role": "user", "content": content}],
+            )
+
         response_text = self._extract_response_text(message)
 
         # Debug logging for API response diagnostics
@@ -168,16 +372,20 @@ Always provide specific, actionable feedback with concrete suggestions."""
             f"response_length={len(response_text)} chars"
         )
 
-        # Check brace balance for truncation detection
+        # Check brace balance for truncation detection. Braces are counted
+        # first; the bracket scans run only when braces already balance, so
+        # the common truncation case stops after two passes.
         open_braces = response_text.count('{')
         close_braces = response_text.count('}')
-        open_brackets = response_text.count('[')
-        close_brackets = response_text.count(']')
+        balanced = open_braces == close_braces
+        if balanced:
+            balanced = response_text.count('[') == response_text.count(']')
 
-        if open_braces != close_braces or open_brackets != close_brackets:
+        if not balanced:
             logger.warning(
                 f"Unbalanced braces/brackets - response likely truncated! "
-                f"braces: {open_braces}/{close_braces}, brackets: {open_brackets}/{close_brackets}"
+                f"braces: {open_braces}/{close_braces}, "
+                f"brackets: {response_text.count('[')}/{response_text.count(']')}"
             )
 
         # Check for truncation
@@ -189,19 +397,107 @@ Always provide specific, actionable feedback with concrete suggestions."""
         if message.stop_reason != "end_turn":
             logger.warning(f"Unexpected stop_reason: {message.stop_reason}, usage={message.usage}")
 
-        return self._parse_json_response(response_text)
+        result = self._parse_json_response(response_text)
+
+        if cache_key is not None:
+            _resp_cache[cache_key] = (time.monotonic(), result)
+            if len(_resp_cache) > self._RESP_CACHE_MAX:
+                _resp_cache.popitem(last=False)
+
+        return result
+
+    async def analyze_many(self, requests: list[AnalyzeRequest]) -> list[dict]:
+        """Analyze multiple JDs concurrently.
+
+        Overlaps network I/O and Claude-side compute instead of paying
+        N serial round-trips. Concurrency is bounded by the
+        claude_max_concurrency setting to stay within API rate limits.
+        """
+        semaphore = asyncio.Semaphore(get_settings().claude_max_concurrency)
+
+        async def _bounded(request: AnalyzeRequest) -> dict:
+            async with semaphore:
+                return await self.analyze(request)
+
+        return await asyncio.gather(*(_bounded(r) for r in requests))
+
+    async def analyze_batch(
+        self, requests: list[AnalyzeRequest], poll_interval: float = 5.0
+    ) -> list[dict]:
+        """Analyze JDs through the Message Batches API.
+
+        Batched requests cost 50% less than the synchronous endpoint but
+        complete asynchronously (typically within an hour). Use for
+        latency-tolerant bulk jobs like offline JD audits; interactive
+        endpoints should keep using analyze()/analyze_many().
+        """
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": f"analyze-{i}",
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": self.MAX_OUTPUT_TOKENS,
+                        "temperature": 0.3,
+                        "system": self.SYSTEM_BLOCKS,
+                        "messages": [{
+                            "role": "user",
+                            "content": self._cached_user_content(
+                                *build_analysis_parts(r.jd_text, r.voice_profile)
+                            ),
+                        }],
+                    },
+                }
+                for i, r in enumerate(requests)
+            ]
+        )
+
+        # Poll with exponential backoff until processing finishes
+        delay = poll_interval
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        parsed: dict[str, dict] = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                raise ValueError(
+                    f"Batch analysis item {entry.custom_id} failed: {entry.result.type}"
+                )
+            text = self._extract_response_text(entry.result.message)
+            parsed[entry.custom_id] = self._parse_json_response(text)
+
+        return [parsed[f"analyze-{i}"] for i in range(len(requests))]
+
+    async def generate_many(
+        self,
+        requests: list[GenerateRequest],
+        voice_profile: Optional[VoiceProfile] = None,
+    ) -> list[dict]:
+        """Generate multiple JDs concurrently (see analyze_many)."""
+        semaphore = asyncio.Semaphore(get_settings().claude_max_concurrency)
+
+        async def _bounded(request: GenerateRequest) -> dict:
+            async with semaphore:
+                return await self.generate(request, voice_profile)
+
+        return await asyncio.gather(*(_bounded(r) for r in requests))
 
     async def generate(
         self, request: GenerateRequest, voice_profile: Optional[VoiceProfile] = None
     ) -> dict:
         """Generate a job description using Claude."""
-        prompt = build_generation_prompt(request, voice_profile)
+        static_part, dynamic_part = build_generation_parts(request, voice_profile)
 
         message = await self.client.messages.create(
             model=self.model,
             max_tokens=4096,
-            system=self.SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            system=self.SYSTEM_BLOCKS,
+            messages=[{
+                "role": "user",
+                "content": self._cached_user_content(static_part, dynamic_part),
+            }],
         )
 
         response_text = self._extract_response_text(message)
@@ -235,7 +531,7 @@ Always provide specific, actionable feedback with concrete suggestions."""
             model=self.model,
             max_tokens=4096,
             temperature=0.2,  # Lower temperature for more consistent, focused output
-            system=self.SYSTEM_PROMPT,
+            system=self.SYSTEM_BLOCKS,
             messages=[{"role": "user", "content": prompt}],
         )
 
@@ -247,25 +543,22 @@ Always provide specific, actionable feedback with concrete suggestions."""
 
         # Clean up any preamble the model might add
         # Remove common prefixes like "Here's the improved version:"
-        cleanup_patterns = [
-            r"^Here['']s the improved (?:version|job description)[:\s]*\n*",
-            r"^Improved (?:version|job description)[:\s]*\n*",
-            r"^Below is the improved[:\s]*\n*",
-        ]
-        for pattern in cleanup_patterns:
-            response_text = re.sub(pattern, "", response_text, flags=re.IGNORECASE)
+        response_text = self._PREAMBLE_RE.sub("", response_text)
 
         return response_text.strip()
 
     async def extract_voice_profile(self, example_jds: list[str]) -> dict:
         """Extract voice profile characteristics from example JDs."""
-        prompt = build_voice_extraction_prompt(example_jds)
+        static_part, dynamic_part = build_voice_extraction_parts(example_jds)
 
         message = await self.client.messages.create(
-            model=self.model,
+            model=self.fast_model,
             max_tokens=2000,
-            system=self.SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            system=self.SYSTEM_BLOCKS,
+            messages=[{
+                "role": "user",
+                "content": self._cached_user_content(static_part, dynamic_part),
+            }],
         )
 
         response_text = self._extract_response_text(message)
@@ -15,35 +15,52 @@ Used by:
 - scoring.py for bias word detection
 - claude_service.py for improvement generation
 """
-from typing import Optional
+import re
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-# Canonical mapping: field name -> list of keywords that indicate this field
+# These tables are read-only after import; they are exposed through
+# MappingProxyType (with tuple values) so callers can't mutate them out from
+# under the precompiled patterns derived below.
+
+# Canonical mapping: field name -> keywords that indicate this field
 # This is the single source of truth for all field/topic mappings
-FIELD_KEYWORDS: dict[str, list[str]] = {
-    "salary": ["salary", "compensation", "pay", "pay range", "wage"],
-    "location": ["location", "remote", "hybrid", "on-site", "office"],
-    "benefits": ["benefits", "perks", "insurance", "401k", "pto"],
-    "team_size": ["team", "team_size", "team size", "team of", "person team"],
-    "requirements_listed": ["requirements", "qualifications"],
-}
+FIELD_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "salary": ("salary", "compensation", "pay", "pay range", "wage"),
+    "location": ("location", "remote", "hybrid", "on-site", "office"),
+    "benefits": ("benefits", "perks", "insurance", "401k", "pto"),
+    "team_size": ("team", "team_size", "team size", "team of", "person team"),
+    "requirements_listed": ("requirements", "qualifications"),
+})
 
 # Reverse mapping: keyword -> field name (derived from FIELD_KEYWORDS)
 # Used for detecting which field a keyword refers to
-KEYWORD_TO_FIELD: dict[str, str] = {
+KEYWORD_TO_FIELD: Mapping[str, str] = MappingProxyType({
     keyword: field
     for field, keywords in FIELD_KEYWORDS.items()
     for keyword in keywords
-}
+})
+
+# One fused alternation per field (plain substring semantics, no word
+# boundaries), presence-tested with .search — one C-level scan per field.
+# Deliberately NOT a single all-fields pattern walked with finditer: its
+# non-overlapping matches let a long keyword from one field swallow text
+# containing another field's keyword ("team office" matches "team of" and
+# skips past "office", losing the location field).
+_FIELD_PATTERNS: Mapping[str, re.Pattern[str]] = MappingProxyType({
+    field: re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    for field, keywords in FIELD_KEYWORDS.items()
+})
 
 # Map question IDs to their corresponding field names
 # Used by QuestionCoverageAnalyzer to skip questions for excluded fields
-QUESTION_TO_FIELD: dict[str, str] = {
+QUESTION_TO_FIELD: Mapping[str, str] = MappingProxyType({
     "compensation": "salary",
     "remote_policy": "location",
     "benefits": "benefits",
     "team_culture": "team_size",
     "requirements_clarity": "requirements_listed",
-}
+})
 
 # =============================================================================
 # BIAS WORD DEFINITIONS
@@ -56,7 +73,7 @@ QUESTION_TO_FIELD: dict[str, str] = {
 
 # Consolidated bias terms with category and replacement
 # Format: word -> {"category": str, "replacement": str}
-BIAS_TERMS: dict[str, dict[str, str]] = {
+BIAS_TERMS: Mapping[str, dict[str, str]] = MappingProxyType({
     # Tech bro culture - exclusionary jargon
     "ninja": {"category": "problematic", "replacement": "expert"},
     "rockstar": {"category": "problematic", "replacement": "top performer"},
@@ -80,20 +97,22 @@ BIAS_TERMS: dict[str, dict[str, str]] = {
     "early career only": {"category": "ageist", "replacement": "entry-level"},
     # Ageist terms - old bias
     "overqualified": {"category": "ageist", "replacement": "highly experienced"},
-}
+})
 
 # Derived: word lists by category (for backward compatibility with scoring.py)
-BIAS_WORD_LISTS: dict[str, list[str]] = {}
-for word, data in BIAS_TERMS.items():
-    category = data["category"]
-    if category not in BIAS_WORD_LISTS:
-        BIAS_WORD_LISTS[category] = []
-    BIAS_WORD_LISTS[category].append(word)
+BIAS_WORD_LISTS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    category: tuple(
+        word for word, data in BIAS_TERMS.items() if data["category"] == category
+    )
+    # dict.fromkeys keeps first-appearance order (a set would reorder
+    # categories between runs under hash randomization)
+    for category in dict.fromkeys(data["category"] for data in BIAS_TERMS.values())
+})
 
 # Derived: word -> replacement mapping (for assessment_service.py)
-BIAS_REPLACEMENTS: dict[str, str] = {
+BIAS_REPLACEMENTS: Mapping[str, str] = MappingProxyType({
     word: data["replacement"] for word, data in BIAS_TERMS.items()
-}
+})
 
 # =============================================================================
 # EXCLUSION PATTERNS
@@ -102,7 +121,7 @@ BIAS_REPLACEMENTS: dict[str, str] = {
 # Used by both backend (assessment_service.py) and frontend (validation.ts).
 # Frontend must be kept in sync manually - this is the source of truth.
 
-EXCLUSION_PATTERNS: list[str] = [
+EXCLUSION_PATTERNS: tuple[str, ...] = (
     "never include",
     "don't include",
     "do not include",
@@ -116,7 +135,22 @@ EXCLUSION_PATTERNS: list[str] = [
     "without salary",
     "without location",
     "without benefits",
-]
+)
+
+# Exclusion patterns fused into one alternation (substring semantics, applied
+# to already-lowercased rule text) so intent detection is a single scan
+# instead of one substring test per pattern
+_EXCLUSION_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in sorted(EXCLUSION_PATTERNS, key=len, reverse=True)
+    )
+)
+
+
+def rule_has_exclusion_intent(rule_lower: str) -> bool:
+    """Check lowercased rule text for exclusion intent ("never include" etc.)."""
+    return bool(_EXCLUSION_RE.search(rule_lower))
 
 # =============================================================================
 # ASSESSMENT CATEGORY WEIGHTS
@@ -124,14 +158,14 @@ EXCLUSION_PATTERNS: list[str] = [
 # Weights for calculating overall assessment score.
 # Used by claude_service.py for improvement generation.
 
-CATEGORY_WEIGHTS: dict[str, float] = {
+CATEGORY_WEIGHTS: Mapping[str, float] = MappingProxyType({
     "inclusivity": 0.25,
     "readability": 0.20,
     "structure": 0.15,
     "completeness": 0.15,
     "clarity": 0.10,
     "voice_match": 0.15,
-}
+})
 
 # =============================================================================
 # ENUM MAPPINGS FOR API RESPONSE PARSING
@@ -173,16 +207,20 @@ def get_fields_for_keywords(text: str) -> set[str]:
     Returns:
         Set of field names found in the text
     """
-    text_lower = text.lower()
-    fields = set()
+    return get_fields_for_lowered(text.lower())
 
-    for field, keywords in FIELD_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                fields.add(field)
-                break  # Found this field, move to next
 
-    return fields
+def get_fields_for_lowered(text_lower: str) -> set[str]:
+    """get_fields_for_keywords for text the caller has already lowercased.
+
+    Callers that lower once and scan several times (e.g. profile rule
+    processing) use this to skip the redundant str.lower copy.
+    """
+    return {
+        field
+        for field, pattern in _FIELD_PATTERNS.items()
+        if pattern.search(text_lower)
+    }
 
 
 def issue_mentions_excluded_field(
@@ -206,12 +244,17 @@ def issue_mentions_excluded_field(
     if not excluded_fields:
         return False
 
-    issue_text = f"{description or ''} {found or ''} {suggestion or ''}".lower()
-
-    for field in excluded_fields:
-        if field in FIELD_KEYWORDS:
-            for keyword in FIELD_KEYWORDS[field]:
-                if keyword in issue_text:
-                    return True
+    # Scan each part directly (skipping empties) instead of allocating a
+    # concatenated copy, and only against the excluded fields' patterns,
+    # short-circuiting on the first hit.
+    for part in (description, found, suggestion):
+        if not part:
+            continue
+        part_lower = part.lower()
+        for field in excluded_fields:
+            # Unknown field names simply never match, as before
+            pattern = _FIELD_PATTERNS.get(field)
+            if pattern is not None and pattern.search(part_lower):
+                return True
 
     return False
@@ -10,6 +10,7 @@ Handles detection of various issues in job descriptions:
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 from app.models.assessment import (
     AssessmentCategory,
@@ -24,11 +25,48 @@ from app.services.scoring import (
 )
 from app.services.field_mappings import (
     BIAS_REPLACEMENTS,
-    EXCLUSION_PATTERNS,
     get_fields_for_keywords,
+    get_fields_for_lowered,
     issue_mentions_excluded_field,
+    rule_has_exclusion_intent,
 )
 
+# Salary-specificity probes for detect_completeness_issues, compiled once
+# instead of going through re's per-call cache on every assessment
+_SALARY_WORD_RE = re.compile(r'\bsalary\b|\bcompensation\b|\bpay\b')
+_SALARY_SPECIFICS_RE = re.compile(
+    r'\$\d|€\d|£\d|\d+k|\d{2,3},?\d{3}|pay\s+range'
+)
+
+
+@lru_cache(maxsize=256)
+def _excluded_fields_for_rules(
+    rule_items: tuple[tuple[RuleType, str, Optional[str]], ...]
+) -> frozenset[str]:
+    """Derive excluded fields from (rule_type, text, target) tuples.
+
+    Memoized: profiles are stable across a user's session, so the same rule
+    set arrives with every analyze request and the pattern/keyword scans
+    only need to run once per distinct profile.
+    """
+    excluded: set[str] = set()
+
+    for rule_type, text, target in rule_items:
+        rule_lower = text.lower()
+
+        # Method 1: Explicit EXCLUDE rule_type
+        if rule_type == RuleType.EXCLUDE:
+            if target:
+                excluded.update(get_fields_for_keywords(target))
+            excluded.update(get_fields_for_lowered(rule_lower))
+
+        # Method 2: Detect exclusion intent from 'custom' rules only
+        elif rule_type == RuleType.CUSTOM:
+            if rule_has_exclusion_intent(rule_lower):
+                excluded.update(get_fields_for_lowered(rule_lower))
+
+    return frozenset(excluded)
+
 
 class IssueDetector:
     """Detects issues in job descriptions using rule-based methods."""
@@ -59,41 +97,33 @@ class IssueDetector:
         if not voice_profile:
             return set()
 
-        excluded: set[str] = set()
-
-        for rule in voice_profile.rules:
-            if not rule.active:
-                continue
-
-            rule_lower = rule.text.lower()
-
-            # Method 1: Explicit EXCLUDE rule_type
-            if rule.rule_type == RuleType.EXCLUDE:
-                if rule.target:
-                    excluded.update(get_fields_for_keywords(rule.target))
-                excluded.update(get_fields_for_keywords(rule_lower))
-
-            # Method 2: Detect exclusion intent from 'custom' rules only
-            elif rule.rule_type == RuleType.CUSTOM:
-                has_exclusion_intent = any(
-                    pattern in rule_lower for pattern in EXCLUSION_PATTERNS
-                )
-                if has_exclusion_intent:
-                    excluded.update(get_fields_for_keywords(rule_lower))
-
-        return excluded
+        rule_items = tuple(
+            (rule.rule_type, rule.text, rule.target)
+            for rule in voice_profile.rules
+            if rule.active
+        )
+        return set(_excluded_fields_for_rules(rule_items))
 
-    def detect_bias_issues(self, text: str) -> list[Issue]:
+    def detect_bias_issues(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> list[Issue]:
         """Detect bias-related issues using word lists."""
         issues = []
-        bias_found = detect_bias_words(text)
+        bias_found = detect_bias_words(text, text_lower)
 
+        # Emit one issue per unique (bias_type, word) pair. The detector
+        # currently returns unique terms, but dedup here keeps downstream
+        # sorting/dedup from ever seeing duplicate Issue models.
+        seen: set[tuple[str, str]] = set()
         for bias_type, words in bias_found.items():
             for word in words:
+                if (bias_type, word) in seen:
+                    continue
+                seen.add((bias_type, word))
                 suggestion = BIAS_REPLACEMENTS.get(
                     word, f"consider alternatives to '{word}'"
                 )
-                issues.append(Issue(
+                issues.append(Issue.model_construct(
                     severity=IssueSeverity.WARNING,
                     category=AssessmentCategory.INCLUSIVITY,
                     description=f"Found {bias_type}-coded word: '{word}'",
@@ -105,12 +135,17 @@ class IssueDetector:
         return issues
 
     def detect_completeness_issues(
-        self, text: str, excluded_fields: Optional[set[str]] = None
+        self,
+        text: str,
+        excluded_fields: Optional[set[str]] = None,
+        text_lower: Optional[str] = None,
     ) -> list[Issue]:
         """Detect missing information issues, respecting excluded fields."""
         issues = []
         excluded = excluded_fields or set()
-        _, missing = calculate_completeness_score(text, excluded)
+        if text_lower is None:
+            text_lower = text.lower()
+        _, missing = calculate_completeness_score(text, excluded, text_lower)
 
         for field in missing:
             if field in excluded:
@@ -119,7 +154,7 @@ class IssueDetector:
             severity = (
                 IssueSeverity.CRITICAL if field == "salary" else IssueSeverity.WARNING
             )
-            issues.append(Issue(
+            issues.append(Issue.model_construct(
                 severity=severity,
                 category=AssessmentCategory.COMPLETENESS,
                 description=f"Missing {field.replace('_', ' ')}",
@@ -129,16 +164,10 @@ class IssueDetector:
 
         # Check for salary mentioned without specifics
         if "salary" not in excluded:
-            text_lower = text.lower()
-            has_salary_word = bool(
-                re.search(r'\bsalary\b|\bcompensation\b|\bpay\b', text_lower)
-            )
-            has_salary_specifics = bool(re.search(
-                r'\$\d|€\d|£\d|\d+k|\d{2,3},?\d{3}|pay\s+range',
-                text_lower
-            ))
+            has_salary_word = bool(_SALARY_WORD_RE.search(text_lower))
+            has_salary_specifics = bool(_SALARY_SPECIFICS_RE.search(text_lower))
             if has_salary_word and not has_salary_specifics:
-                issues.append(Issue(
+                issues.append(Issue.model_construct(
                     severity=IssueSeverity.CRITICAL,
                     category=AssessmentCategory.COMPLETENESS,
                     description="Missing salary range specifics",
@@ -154,7 +183,7 @@ class IssueDetector:
         readability = calculate_readability_score(text)
 
         if readability < 60:
-            issues.append(Issue(
+            issues.append(Issue.model_construct(
                 severity=IssueSeverity.WARNING,
                 category=AssessmentCategory.READABILITY,
                 description="Reading level too complex",
@@ -170,9 +199,15 @@ class IssueDetector:
         """Detect all rule-based issues, respecting voice profile exclusions."""
         excluded_fields = self.get_excluded_fields_from_profile(voice_profile)
 
+        # Lowercase once and share it; bias and completeness detection
+        # previously each lowered the full JD independently.
+        text_lower = text.lower()
+
         issues = []
-        issues.extend(self.detect_bias_issues(text))
-        issues.extend(self.detect_completeness_issues(text, excluded_fields))
+        issues.extend(self.detect_bias_issues(text, text_lower))
+        issues.extend(
+            self.detect_completeness_issues(text, excluded_fields, text_lower)
+        )
         issues.extend(self.detect_readability_issues(text))
         return issues
 
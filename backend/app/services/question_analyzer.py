@@ -174,6 +174,21 @@ CANDIDATE_QUESTIONS = {
     },
 }
 
+# Compile every detection pattern once at import (with IGNORECASE baked in)
+# instead of re-parsing ~60 pattern strings on each analyze() call. Each
+# question's patterns are additionally fused into a single alternation so
+# coverage detection scans the JD once per question, not once per pattern.
+_QUESTION_PATTERNS: dict[str, re.Pattern[str]] = {}
+for _qid, _qdata in CANDIDATE_QUESTIONS.items():
+    _QUESTION_PATTERNS[_qid] = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in _qdata["detection_patterns"]),
+        re.IGNORECASE,
+    )
+    _qdata["detection_patterns"] = [
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in _qdata["detection_patterns"]
+    ]
+
 
 class QuestionCoverageAnalyzer:
     """Analyzes whether a JD answers common candidate questions."""
@@ -200,20 +215,21 @@ class QuestionCoverageAnalyzer:
             is_answered = False
             evidence = None
 
-            for pattern in qdata["detection_patterns"]:
-                match = re.search(pattern, jd_text, re.IGNORECASE)
-                if match:
-                    is_answered = True
-                    # Extract surrounding context as evidence
-                    start = max(0, match.start() - 30)
-                    end = min(len(jd_text), match.end() + 70)
-                    evidence = jd_text[start:end].strip()
-                    # Clean up the evidence
-                    if start > 0:
-                        evidence = "..." + evidence
-                    if end < len(jd_text):
-                        evidence = evidence + "..."
-                    break
+            # Single fused-alternation scan per question; the leftmost hit
+            # across all of the question's patterns provides the evidence
+            match = _QUESTION_PATTERNS[qid].search(jd_text)
+            if match:
+                is_answered = True
+                # Extract surrounding context as evidence, with ellipses
+                # where the window is clipped (assembled in one pass
+                # instead of two conditional concats)
+                start = max(0, match.start() - 30)
+                end = min(len(jd_text), match.end() + 70)
+                evidence = (
+                    f"{'...' if start > 0 else ''}"
+                    f"{jd_text[start:end].strip()}"
+                    f"{'...' if end < len(jd_text) else ''}"
+                )
 
             results.append(
                 QuestionCoverage(
@@ -255,18 +271,21 @@ class QuestionCoverageAnalyzer:
         """
         boost = 0
 
+        # Index once instead of one linear scan per question of interest
+        by_id = {q.question_id: q for q in coverage}
+
         # Salary transparency boost (biggest impact)
-        salary_q = next((q for q in coverage if q.question_id == "compensation"), None)
+        salary_q = by_id.get("compensation")
         if salary_q and not salary_q.is_answered:
             boost += 30
 
         # Remote policy boost
-        remote_q = next((q for q in coverage if q.question_id == "remote_policy"), None)
+        remote_q = by_id.get("remote_policy")
         if remote_q and not remote_q.is_answered:
             boost += 10
 
         # Requirements clarity boost (affects diversity)
-        req_q = next((q for q in coverage if q.question_id == "requirements_clarity"), None)
+        req_q = by_id.get("requirements_clarity")
         if req_q and not req_q.is_answered:
             boost += 15
 
@@ -7,11 +7,86 @@ Includes readability, structure, completeness, and bias detection.
 """
 
 import re
-import textstat
+from functools import lru_cache
 from typing import Optional
 
 from app.services.field_mappings import BIAS_WORD_LISTS
 
+# One compiled alternation per bias category (longest-first), so detection is
+# a single C-level scan per category instead of one regex search per term.
+# Terms are lowercased to match the lowercased text — BIAS_TERMS stores
+# "native English speaker" with capitals, which the old per-term patterns
+# could never match against text_lower.
+_BIAS_PATTERNS: dict[str, re.Pattern[str]] = {
+    bias_type: re.compile(
+        r"\b(?:"
+        + "|".join(
+            re.escape(term.lower())
+            for term in sorted(word_list, key=len, reverse=True)
+        )
+        + r")\b"
+    )
+    for bias_type, word_list in BIAS_WORD_LISTS.items()
+}
+
+
+# Patterns used on every scoring pass, compiled once at import instead of
+# going through re's per-call cache lookup
+
+# A bullet line (optionally indented) that doesn't already end in sentence
+# punctuation. The lookbehind also rejects whitespace so a bare marker like
+# "- " is left alone, and trailing blanks stay outside the captured group —
+# matching the strip/rstrip handling of the old per-line loop.
+_BULLET_NO_PUNCT_RE = re.compile(
+    r'^([ \t]*(?:[\-\*\•][ \t]|\d+[\.\)][ \t]|[a-z]\)[ \t])[^\r\n]*?)'
+    r'(?<![.!?:;\s])[ \t\r]*$',
+    re.MULTILINE,
+)
+
+# Each section's patterns fused into one alternation so detection is one
+# scan per section rather than one per pattern. Not fused further into a
+# single named-group pass: we need every section's presence (no early exit
+# to win) and lastgroup attribution breaks on patterns with inner groups.
+_SECTION_PATTERNS: dict[str, re.Pattern[str]] = {
+    section: re.compile("|".join(f"(?:{p})" for p in patterns))
+    for section, patterns in {
+        "about": [r"about\s+(us|the\s+company)", r"who\s+we\s+are", r"company\s+overview"],
+        "role": [r"(the\s+)?role", r"position", r"what\s+you.?ll\s+do", r"responsibilities"],
+        "requirements": [r"requirements?", r"qualifications?", r"what\s+you.?ll?\s+(need|bring)", r"must\s+have"],
+        "benefits": [r"benefits?", r"what\s+we\s+offer", r"perks?", r"compensation"],
+        "nice_to_have": [r"nice\s+to\s+have", r"bonus", r"preferred", r"plus"],
+    }.items()
+}
+
+# The three bullet styles fused into one anchored alternation so structure
+# scoring finds the first bullet in a single scan instead of three
+_STRUCTURE_BULLET_RE = re.compile(r"^(?:[\-\*\•]|\d+\.|[a-z]\))", re.MULTILINE)
+_HEADER_RE = re.compile(r"^#+\s|^[A-Z][A-Za-z\s]+:?\s*$", re.MULTILINE)
+_WORD_RE = re.compile(r"\S+")
+
+# Tokenizers for the direct Flesch-Kincaid computation
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+_ALPHA_WORD_RE = re.compile(r"[a-z]+")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+
+_COMPLETENESS_PATTERNS: dict[str, re.Pattern[str]] = {
+    "salary": re.compile(
+        r'\$\d|€\d|£\d|\d+k|\d{2},?\d{3}|salary|compensation|pay\s+range'
+    ),
+    "location": re.compile(
+        r'remote|hybrid|on-?site|office|location|based\s+in|\bcity\b|work\s+from\s+(home|anywhere)|wfh|in[- ]?person|distributed'
+    ),
+    "team_size": re.compile(
+        r'\d+[\-\s]person|\d+\s+people|team\s+of\s+\d|small\s+team|large\s+team'
+    ),
+    "benefits": re.compile(
+        r'benefits?|health|insurance|401k|pto|vacation|equity|stock'
+    ),
+    "requirements_listed": re.compile(
+        r'requirements?|qualifications?|must\s+have|you.?ll\s+need'
+    ),
+}
+
 
 def _preprocess_for_readability(text: str) -> str:
     """
@@ -24,30 +99,57 @@ def _preprocess_for_readability(text: str) -> str:
     Are treated as one long sentence, causing inflated grade levels.
 
     This adds periods to bullet points that don't end with punctuation,
-    ensuring proper sentence detection.
+    ensuring proper sentence detection. Done as one multiline substitution
+    over the whole text rather than a Python loop over its lines.
+    """
+    return _BULLET_NO_PUNCT_RE.sub(r'\1.', text)
+
+
+def _count_syllables(word: str) -> int:
+    """Estimate syllables in a lowercase word via vowel-group counting.
+
+    Standard heuristic: each run of vowels is one syllable, a trailing
+    silent 'e' is dropped (but kept for words like 'table'/'free'), and
+    every word has at least one syllable.
     """
-    lines = text.split('\n')
-    processed = []
+    groups = len(_VOWEL_GROUP_RE.findall(word))
+    if groups > 1 and word.endswith("e") and not word.endswith(("le", "ee")):
+        groups -= 1
+    return max(1, groups)
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            processed.append(line)
-            continue
 
-        # Check if it's a bullet point (starts with -, *, •, numbers, letters)
-        is_bullet = bool(re.match(r'^[\-\*\•]\s|^\d+[\.\)]\s|^[a-z]\)\s', stripped))
+def _flesch_kincaid_grade(text: str) -> float:
+    """Flesch-Kincaid grade level: 0.39*(words/sentences) + 11.8*(syllables/words) - 15.59.
 
-        # Check if line ends with sentence-ending punctuation
-        ends_with_punct = bool(re.search(r'[.!?:;]$', stripped))
+    Computed directly instead of through textstat, whose recent versions
+    pull NLTK corpora (cmudict/punkt) at runtime for the same formula —
+    a network fetch we don't want in the request path, and far more
+    machinery than one ratio needs.
+    """
+    sentences = sum(
+        1 for part in _SENTENCE_SPLIT_RE.split(text) if part.strip()
+    )
+    words = _ALPHA_WORD_RE.findall(text.lower())
+    if not sentences or not words:
+        return 0.0
+
+    syllables = sum(_count_syllables(word) for word in words)
+    return (
+        0.39 * (len(words) / sentences)
+        + 11.8 * (syllables / len(words))
+        - 15.59
+    )
 
-        if is_bullet and not ends_with_punct:
-            # Add a period to make it a proper sentence for analysis
-            line = line.rstrip() + '.'
 
-        processed.append(line)
+@lru_cache(maxsize=32)
+def _grade_level(text: str) -> float:
+    """Flesch-Kincaid grade for the preprocessed text.
 
-    return '\n'.join(processed)
+    Memoized because every assessment scores readability twice on the same
+    JD (rule-based category scores and issue detection), and the syllable
+    counting dominates rule-based scoring cost.
+    """
+    return _flesch_kincaid_grade(_preprocess_for_readability(text))
 
 
 def calculate_readability_score(text: str) -> float:
@@ -59,11 +161,8 @@ def calculate_readability_score(text: str) -> float:
     if not text.strip():
         return 0
 
-    # Preprocess to handle bullet points (critical for JDs)
-    processed_text = _preprocess_for_readability(text)
-
     # Get Flesch-Kincaid Grade Level (lower = easier to read)
-    grade_level = textstat.flesch_kincaid_grade(processed_text)
+    grade_level = _grade_level(text)
 
     # Target is 6-8 grade level
     # Score 100 for grade 6-8, decrease for higher/lower
@@ -84,7 +183,8 @@ def calculate_length_score(text: str) -> float:
     Calculate length score (0-100).
     Optimal: 300-650 words.
     """
-    word_count = len(text.split())
+    # Count without materializing a list of every word like str.split does
+    word_count = sum(1 for _ in _WORD_RE.finditer(text))
 
     if 300 <= word_count <= 650:
         return 100
@@ -99,34 +199,31 @@ def calculate_length_score(text: str) -> float:
         return max(40, 100 - (word_count - 650) * 0.15)
 
 
-def detect_structure_sections(text: str) -> dict[str, bool]:
+def detect_structure_sections(
+    text: str, text_lower: Optional[str] = None
+) -> dict[str, bool]:
     """
     Detect presence of common JD sections.
     Returns dict of section_type -> found.
+
+    Callers that already hold a lowercased copy can pass it via text_lower
+    to skip re-lowering.
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
 
-    section_patterns = {
-        "about": [r"about\s+(us|the\s+company)", r"who\s+we\s+are", r"company\s+overview"],
-        "role": [r"(the\s+)?role", r"position", r"what\s+you.?ll\s+do", r"responsibilities"],
-        "requirements": [r"requirements?", r"qualifications?", r"what\s+you.?ll?\s+(need|bring)", r"must\s+have"],
-        "benefits": [r"benefits?", r"what\s+we\s+offer", r"perks?", r"compensation"],
-        "nice_to_have": [r"nice\s+to\s+have", r"bonus", r"preferred", r"plus"],
+    return {
+        section: bool(pattern.search(text_lower))
+        for section, pattern in _SECTION_PATTERNS.items()
     }
 
-    found = {}
-    for section, patterns in section_patterns.items():
-        found[section] = any(re.search(p, text_lower) for p in patterns)
 
-    return found
-
-
-def calculate_structure_score(text: str) -> float:
+def calculate_structure_score(text: str, text_lower: Optional[str] = None) -> float:
     """
     Calculate structure score (0-100).
     Checks for sections, bullet points, scanability.
     """
-    sections = detect_structure_sections(text)
+    sections = detect_structure_sections(text, text_lower)
     score = 0
 
     # Core sections (weighted)
@@ -144,77 +241,82 @@ def calculate_structure_score(text: str) -> float:
         score += 10
 
     # Check for bullet points or lists
-    bullet_patterns = [r"^[\-\*\•]", r"^\d+\.", r"^[a-z]\)"]
-    has_bullets = any(
-        re.search(p, text, re.MULTILINE) for p in bullet_patterns
-    )
+    has_bullets = bool(_STRUCTURE_BULLET_RE.search(text))
     if has_bullets:
         score = min(100, score + 10)
 
     # Check for headers (markdown or plain)
-    has_headers = bool(re.search(r"^#+\s|^[A-Z][A-Za-z\s]+:?\s*$", text, re.MULTILINE))
+    has_headers = bool(_HEADER_RE.search(text))
     if has_headers:
         score = min(100, score + 5)
 
     return min(100, score)
 
 
-def detect_bias_words(text: str) -> dict[str, list[str]]:
+def detect_bias_words(
+    text: str, text_lower: Optional[str] = None
+) -> dict[str, list[str]]:
     """
     Detect potentially biased words in text using word boundary matching.
     Returns dict of bias_type -> list of found words/phrases.
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
 
     found: dict[str, list[str]] = {}
     for bias_type, word_list in BIAS_WORD_LISTS.items():
-        matches = []
-        for term in word_list:
-            # Use word boundaries to match whole terms (including multi-word phrases)
-            pattern = r'\b' + re.escape(term) + r'\b'
-            if re.search(pattern, text_lower):
-                matches.append(term)
-        if matches:
-            found[bias_type] = matches
+        hits = set(_BIAS_PATTERNS[bias_type].findall(text_lower))
+        if hits:
+            # Preserve the original definition order (and casing) of terms
+            found[bias_type] = [term for term in word_list if term.lower() in hits]
 
     return found
 
 
-def check_completeness(text: str) -> dict[str, bool]:
+def check_completeness(
+    text: str, text_lower: Optional[str] = None
+) -> dict[str, bool]:
     """
     Check for presence of key information.
     Returns dict of field -> present.
     """
-    text_lower = text.lower()
-
-    checks = {
-        "salary": bool(re.search(
-            r'\$\d|€\d|£\d|\d+k|\d{2},?\d{3}|salary|compensation|pay\s+range',
-            text_lower
-        )),
-        "location": bool(re.search(
-            r'remote|hybrid|on-?site|office|location|based\s+in|\bcity\b|work\s+from\s+(home|anywhere)|wfh|in[- ]?person|distributed',
-            text_lower
-        )),
-        "team_size": bool(re.search(
-            r'\d+[\-\s]person|\d+\s+people|team\s+of\s+\d|small\s+team|large\s+team',
-            text_lower
-        )),
-        "benefits": bool(re.search(
-            r'benefits?|health|insurance|401k|pto|vacation|equity|stock',
-            text_lower
-        )),
-        "requirements_listed": bool(re.search(
-            r'requirements?|qualifications?|must\s+have|you.?ll\s+need',
-            text_lower
-        )),
+    if text_lower is None:
+        text_lower = text.lower()
+
+    return {
+        field: bool(pattern.search(text_lower))
+        for field, pattern in _COMPLETENESS_PATTERNS.items()
     }
 
-    return checks
+
+_COMPLETENESS_WEIGHTS = {
+    "salary": 30,  # Most important - research shows huge impact
+    "location": 20,
+    "requirements_listed": 25,
+    "benefits": 15,
+    "team_size": 10,
+}
+
+
+@lru_cache(maxsize=32)
+def _scaled_completeness_weights(excluded: frozenset[str]) -> dict[str, float]:
+    """Weights with excluded fields dropped and the rest rescaled to sum to 100.
+
+    Memoized: only 2^5 exclusion combinations exist, so the filter/sum/scale
+    arithmetic runs once per combination instead of once per call. Returns an
+    empty dict when every field is excluded.
+    """
+    active = {k: v for k, v in _COMPLETENESS_WEIGHTS.items() if k not in excluded}
+    if not active:
+        return {}
+    scale_factor = 100 / sum(active.values())
+    return {k: v * scale_factor for k, v in active.items()}
 
 
 def calculate_completeness_score(
-    text: str, excluded_fields: Optional[set[str]] = None
+    text: str,
+    excluded_fields: Optional[set[str]] = None,
+    text_lower: Optional[str] = None,
 ) -> tuple[float, list[str]]:
     """
     Calculate completeness score and return missing elements.
@@ -223,26 +325,13 @@ def calculate_completeness_score(
     Returns (score, list of missing elements).
     """
     excluded = excluded_fields or set()
-    checks = check_completeness(text)
-
-    weights = {
-        "salary": 30,  # Most important - research shows huge impact
-        "location": 20,
-        "requirements_listed": 25,
-        "benefits": 15,
-        "team_size": 10,
-    }
-
-    # Filter out excluded fields and redistribute weights proportionally
-    active_weights = {k: v for k, v in weights.items() if k not in excluded}
+    checks = check_completeness(text, text_lower)
 
-    if active_weights:
-        # Scale weights so they still sum to 100
-        total_active_weight = sum(active_weights.values())
-        scale_factor = 100 / total_active_weight
+    scaled_weights = _scaled_completeness_weights(frozenset(excluded))
 
+    if scaled_weights:
         score = sum(
-            active_weights[k] * scale_factor
+            scaled_weights[k]
             for k, v in checks.items()
             if v and k not in excluded
         )
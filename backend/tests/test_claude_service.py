@@ -495,3 +495,49 @@ def test_inactive_rules_not_in_prompt():
 
     assert "<rule>Active rule</rule>" in prompt
     assert "Inactive rule" not in prompt
+
+
+@pytest.mark.asyncio
+async def test_analyze_many_runs_all_requests(claude_service):
+    """analyze_many fans out concurrent analyze calls and preserves order."""
+    mock_message = MagicMock()
+    mock_message.stop_reason = "end_turn"
+    mock_message.content = [MagicMock(text='{"scores": {"inclusivity": 80}}')]
+
+    with patch.object(claude_service.client.messages, "create", new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = mock_message
+
+        requests = [
+            AnalyzeRequest(jd_text=f"Job description number {i} with enough text.")
+            for i in range(3)
+        ]
+        results = await claude_service.analyze_many(requests)
+
+        assert mock_create.call_count == 3
+        assert all(r == {"scores": {"inclusivity": 80}} for r in results)
+
+
+@pytest.mark.asyncio
+async def test_analyze_caches_identical_requests(claude_service):
+    """Repeated identical analyze calls hit the response cache, not the API."""
+    from app.services import claude_service as claude_service_module
+
+    claude_service_module._resp_cache.clear()
+
+    mock_message = MagicMock()
+    mock_message.stop_reason = "end_turn"
+    mock_message.content = [MagicMock(text='{"scores": {"clarity": 70}}')]
+
+    request = AnalyzeRequest(jd_text="A job description with plenty of detail.")
+
+    with patch.object(claude_service.client.messages, "create", new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = mock_message
+
+        first = await claude_service.analyze(request)
+        second = await claude_service.analyze(request)
+        assert mock_create.call_count == 1
+        assert first == second
+
+        # use_cache=False forces a fresh API call
+        await claude_service.analyze(request, use_cache=False)
+        assert mock_create.call_count == 2
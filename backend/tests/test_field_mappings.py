@@ -80,6 +80,12 @@ class TestGetFieldsForKeywords:
             result = get_fields_for_keywords(keywords[0])
             assert field in result, f"Field '{field}' not detected with keyword '{keywords[0]}'"
 
+    def test_overlapping_keywords_both_detected(self):
+        """Keywords that overlap in the text should each yield their field."""
+        # "team of" (team_size) overlaps "office" (location) in "team office";
+        # a non-overlapping scan would consume "team of" and miss "office"
+        assert get_fields_for_keywords("team office") == {"team_size", "location"}
+
 
 class TestIssueMentionsExcludedField:
     """Test issue_mentions_excluded_field function."""
@@ -182,3 +188,13 @@ class TestIssueMentionsExcludedField:
             suggestion=None,
             excluded_fields={"unknown_field"},
         )
+
+    def test_overlapping_keyword_still_filtered(self):
+        """An excluded field's keyword overlapping another keyword should still match."""
+        # "office" (location) overlaps "team of" (team_size) in "team office"
+        assert issue_mentions_excluded_field(
+            description="Some issue",
+            found="team office",
+            suggestion=None,
+            excluded_fields={"location"},
+        )